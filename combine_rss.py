@@ -1,4 +1,7 @@
 import feedparser
+import heapq
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 import re
@@ -68,14 +71,27 @@ def extract_image(entry):
 
     return None
 
+def parse_feed(feed_url):
+    """Parse one feed, returning the exception instead of raising it"""
+    try:
+        return feedparser.parse(feed_url)
+    except Exception as e:
+        return e
+
 def fetch_items(feed_tuples):
     all_items = []
     images_found = 0
 
-    for feed_url, archive_prefix in feed_tuples:
+    # feedparser blocks on HTTP, so download every feed at once
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        feeds = list(ex.map(parse_feed, [feed_url for feed_url, _ in feed_tuples]))
+
+    for (feed_url, archive_prefix), feed in zip(feed_tuples, feeds):
         print(f"Fetching: {feed_url}")
+        if isinstance(feed, Exception):
+            print(f"  ❌ Error: {feed}")
+            continue
         try:
-            feed = feedparser.parse(feed_url)
             for entry in feed.entries:
                 if not hasattr(entry, "link"):
                     continue
@@ -103,47 +119,50 @@ def fetch_items(feed_tuples):
                     "link": archive_link,
                     "description": entry.get("description", ""),
                     "pubDate": pub_str,
-                    "pub_dt": pub_dt,
+                    "pub_ts": int(pub_dt.timestamp()),
                     "image": image_url
                 })
         except Exception as e:
             print(f"  ❌ Error: {e}")
 
-    all_items.sort(key=lambda x: x["pub_dt"], reverse=True)
-
-    limited_items = all_items[:500]
+    limited_items = heapq.nlargest(500, all_items, key=itemgetter("pub_ts"))
     print(f"\n✅ Total items: {len(limited_items)}")
     print(f"📸 Items with images: {sum(1 for i in limited_items if i['image'])}")
 
     return limited_items
 
-def create_rss(items):
-    """Create RSS XML manually to avoid namespace issues"""
-    xml_lines = ['<?xml version="1.0" encoding="UTF-8"?>']
-    xml_lines.append('<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">')
-    xml_lines.append('  <channel>')
-    xml_lines.append('    <title>Combined Economist + Project Syndicate RSS Feed</title>')
-    xml_lines.append('    <link>https://yourusername.github.io/combined.xml</link>')
-    xml_lines.append('    <description>Combined feed: The Economist and Project Syndicate with archive.is links</description>')
-
-    for item in items:
-        xml_lines.append('    <item>')
-        xml_lines.append(f'      <title>{escape_xml(item["title"])}</title>')
-        xml_lines.append(f'      <link>{escape_xml(item["link"])}</link>')
-        xml_lines.append(f'      <description>{escape_xml(item["description"])}</description>')
-        xml_lines.append(f'      <pubDate>{item["pubDate"]}</pubDate>')
-
-        if item["image"]:
-            xml_lines.append(f'      <media:thumbnail url="{escape_xml(item["image"])}" />')
-            xml_lines.append(f'      <media:content url="{escape_xml(item["image"])}" medium="image" />')
-            xml_lines.append(f'      <enclosure url="{escape_xml(item["image"])}" type="image/jpeg" />')
-
-        xml_lines.append('    </item>')
-
-    xml_lines.append('  </channel>')
-    xml_lines.append('</rss>')
-
-    return '\n'.join(xml_lines)
+def create_rss(items, outpath="combined.xml"):
+    """Write RSS XML manually to avoid namespace issues, one item at a time"""
+    with open(outpath, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">\n')
+        f.write('  <channel>\n')
+        f.write('    <title>Combined Economist + Project Syndicate RSS Feed</title>\n')
+        f.write('    <link>https://yourusername.github.io/combined.xml</link>\n')
+        f.write('    <description>Combined feed: The Economist and Project Syndicate with archive.is links</description>\n')
+
+        for item in items:
+            image_xml = ""
+            if item["image"]:
+                image = escape_xml(item["image"])
+                image_xml = (
+                    f'      <media:thumbnail url="{image}" />\n'
+                    f'      <media:content url="{image}" medium="image" />\n'
+                    f'      <enclosure url="{image}" type="image/jpeg" />\n'
+                )
+
+            f.write(
+                '    <item>\n'
+                f'      <title>{escape_xml(item["title"])}</title>\n'
+                f'      <link>{escape_xml(item["link"])}</link>\n'
+                f'      <description>{escape_xml(item["description"])}</description>\n'
+                f'      <pubDate>{item["pubDate"]}</pubDate>\n'
+                f'{image_xml}'
+                '    </item>\n'
+            )
+
+        f.write('  </channel>\n')
+        f.write('</rss>')
 
 if __name__ == "__main__":
     print("=" * 70)
@@ -151,10 +170,7 @@ if __name__ == "__main__":
     print("=" * 70)
 
     items = fetch_items(rss_feeds)
-    rss_xml = create_rss(items)
-
-    with open("combined.xml", "w", encoding="utf-8") as f:
-        f.write(rss_xml)
+    create_rss(items)
 
     print("\n✅ Combined RSS feed created successfully (combined.xml)")
     print("=" * 70)
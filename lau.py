@@ -1,18 +1,22 @@
 #!/usr/bin/env python3
 # lau.py - Combined Economist + Project Syndicate RSS using BotBrowser + Playwright CDP
 
-import feedparser
-import xml.etree.ElementTree as ET
+from lxml import etree, html as lxml_html
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from bs4 import BeautifulSoup
 import time
 import sys
 import os
 import re
+import gzip
+import heapq
 import random
+import sqlite3
 import subprocess
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 
 # ------------------------------
 # CONFIG
@@ -21,6 +25,30 @@ import requests
 PER_FEED_LIMIT = 10
 MAX_ITEMS = 500
 TIMEOUT_MS = 90000
+FEED_TIMEOUT_S = 30
+FEED_FETCH_WORKERS = 8
+
+# Successfully extracted articles are cached so re-runs skip the browser.
+# Archive snapshots don't change, so entries can live as long as feeds list them.
+ARTICLE_CACHE_DB = os.environ.get("ECO_CACHE_DB", "eco_cache.db")
+ARTICLE_CACHE_TTL_S = 30 * 86400
+
+# Set ECO_DEBUG=1 to dump the HTML of short extractions to debug_*.html.gz
+DEBUG_DUMPS = bool(os.environ.get("ECO_DEBUG"))
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/131.0.0.0 Safari/537.36"
+)
+
+# One keep-alive session for every plain HTTP call (feeds, CDP health checks).
+# The pool is sized so concurrent feed downloads to one host never queue.
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = USER_AGENT
+_http_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=FEED_FETCH_WORKERS)
+_SESSION.mount("http://", _http_adapter)
+_SESSION.mount("https://", _http_adapter)
 
 # Each entry: (feed_url, archive_prefix)
 # Economist uses a fixed short-URL archive slug; PS uses /newest/ to get latest capture
@@ -51,14 +79,36 @@ RSS_FEEDS = [
 BOTBROWSER_BINARY   = os.environ.get("BOTBROWSER_PATH", "./BotBrowser/dist/botbrowser")
 BOTBROWSER_CDP_PORT = int(os.environ.get("BOTBROWSER_CDP_PORT", "9222"))
 BOTBROWSER_PROFILE  = os.environ.get("BOTBROWSER_PROFILE", "")
+# Persistent profile dir: cookies (archive.is clearance included) and HTTP
+# cache survive restarts and, when the directory is cached, whole runs
+BOTBROWSER_USER_DATA_DIR = os.environ.get("BOTBROWSER_USER_DATA_DIR", "")
+
+# Only the article DOM is read, so skip heavy subresources at the network layer
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.css", "*.mp4", "*.webm",
+    # Third-party analytics and ad beacons
+    "*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*",
+    "*googlesyndication.com*", "*facebook.net*", "*segment.com*", "*segment.io*",
+    "*scorecardresearch.com*", "*chartbeat.com*", "*hotjar.com*",
+]
 
 _botbrowser_proc: subprocess.Popen | None = None
 
+# One Playwright connection and page are shared by every article fetch
+_pw = None
+_pw_browser = None
+_pw_page = None
+# True when _pw_page lives in the browser's default (persistent) context
+_pw_default_context = False
+
 
 def _start_botbrowser() -> bool:
     """Launch a fresh BotBrowser process and wait for CDP to be ready."""
     global _botbrowser_proc
 
+    _close_page()
+
     if _botbrowser_proc is not None and _botbrowser_proc.poll() is None:
         print(f"Killing existing BotBrowser (pid {_botbrowser_proc.pid})", file=sys.stderr)
         _botbrowser_proc.kill()
@@ -80,9 +130,25 @@ def _start_botbrowser() -> bool:
         f"--remote-debugging-port={BOTBROWSER_CDP_PORT}",
         "--remote-debugging-address=127.0.0.1",
         "--disable-blink-features=AutomationControlled",
+        # Nothing below is needed to read article text
+        "--blink-settings=imagesEnabled=false",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--disable-translate",
+        "--mute-audio",
     ]
     if BOTBROWSER_PROFILE:
         cmd.append(f"--bot-profile={BOTBROWSER_PROFILE}")
+    if BOTBROWSER_USER_DATA_DIR:
+        os.makedirs(BOTBROWSER_USER_DATA_DIR, exist_ok=True)
+        # A restored profile still carries the previous host's singleton lock
+        for name in ("SingletonLock", "SingletonSocket", "SingletonCookie"):
+            try:
+                os.unlink(os.path.join(BOTBROWSER_USER_DATA_DIR, name))
+            except FileNotFoundError:
+                pass
+        cmd.append(f"--user-data-dir={BOTBROWSER_USER_DATA_DIR}")
 
     print(f"Launching BotBrowser: {' '.join(cmd)}", file=sys.stderr)
     try:
@@ -96,15 +162,21 @@ def _start_botbrowser() -> bool:
         return False
 
     cdp_url = f"http://127.0.0.1:{BOTBROWSER_CDP_PORT}/json/version"
-    for _ in range(30):
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        if _botbrowser_proc.poll() is not None:
+            print(f"⚠️  BotBrowser exited during startup (code {_botbrowser_proc.returncode})",
+                  file=sys.stderr)
+            return False
         try:
-            r = requests.get(cdp_url, timeout=2)
+            r = _SESSION.get(cdp_url, timeout=2)
             if r.status_code == 200:
                 print(f"✓ BotBrowser CDP ready on port {BOTBROWSER_CDP_PORT}", file=sys.stderr)
                 return True
         except Exception:
             pass
-        time.sleep(0.5)
+        # Short interval: CDP usually comes up well under a second after launch
+        time.sleep(0.1)
 
     print("⚠️  BotBrowser CDP did not become ready within 15 s", file=sys.stderr)
     return False
@@ -117,72 +189,140 @@ def _ensure_botbrowser_running() -> bool:
     return _start_botbrowser()
 
 
+def _open_page():
+    """Connect to BotBrowser over CDP once and return the shared page."""
+    global _pw, _pw_browser, _pw_page, _pw_default_context
+
+    if _pw_page is not None and not _pw_page.is_closed():
+        return _pw_page
+
+    _close_page()
+
+    from playwright.sync_api import sync_playwright
+
+    _pw = sync_playwright().start()
+    _pw_browser = _pw.chromium.connect_over_cdp(f"http://127.0.0.1:{BOTBROWSER_CDP_PORT}")
+    _pw_default_context = bool(BOTBROWSER_USER_DATA_DIR and _pw_browser.contexts)
+    if _pw_default_context:
+        # Only the default context reads and writes the on-disk profile
+        context = _pw_browser.contexts[0]
+        _pw_page = context.new_page()
+        _pw_page.set_viewport_size({"width": 1920, "height": 1080})
+    else:
+        context = _pw_browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent=USER_AGENT,
+            locale="en-US",
+            java_script_enabled=True,
+        )
+        _pw_page = context.new_page()
+
+    cdp = context.new_cdp_session(_pw_page)
+    cdp.send("Network.enable")
+    if _pw_default_context:
+        # The default context can't take user_agent/locale, so apply them here
+        cdp.send("Network.setUserAgentOverride",
+                 {"userAgent": USER_AGENT, "acceptLanguage": "en-US"})
+    cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return _pw_page
+
+
+def _close_page():
+    global _pw, _pw_browser, _pw_page
+
+    # browser.close() over CDP leaves default-context pages open, so close ours first
+    if _pw_default_context and _pw_page is not None:
+        try:
+            _pw_page.close()
+        except Exception:
+            pass
+    if _pw_browser is not None:
+        try:
+            _pw_browser.close()
+        except Exception:
+            pass
+    if _pw is not None:
+        try:
+            _pw.stop()
+        except Exception:
+            pass
+    _pw = _pw_browser = _pw_page = None
+
+
+def _blank_page(page):
+    """Navigate away so the article DOM is released before the next fetch."""
+    try:
+        page.goto("about:blank")
+    except Exception:
+        _close_page()
+
+
 def _botbrowser_fetch_once(url: str) -> str | None:
     """Single attempt to fetch a URL via BotBrowser + Playwright CDP."""
     try:
-        from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
+        from playwright.sync_api import TimeoutError as PWTimeout
     except ImportError:
         print("⚠️  playwright is not installed.", file=sys.stderr)
         return None
 
-    cdp_endpoint = f"http://127.0.0.1:{BOTBROWSER_CDP_PORT}"
     print(f"  BotBrowser GET: {url}", file=sys.stderr)
 
     try:
-        with sync_playwright() as pw:
-            browser = pw.chromium.connect_over_cdp(cdp_endpoint)
-            context = browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/131.0.0.0 Safari/537.36"
-                ),
-                locale="en-US",
-                java_script_enabled=True,
-            )
-            page = context.new_page()
+        page = _open_page()
 
-            try:
-                page.goto(url, wait_until="domcontentloaded", timeout=TIMEOUT_MS)
-            except PWTimeout:
-                print(f"  ⚠️  BotBrowser navigation timed out for {url}", file=sys.stderr)
-                page.close(); context.close(); browser.close()
-                return None
+        try:
+            page.goto(url, wait_until="domcontentloaded", timeout=TIMEOUT_MS)
+        except PWTimeout:
+            print(f"  ⚠️  BotBrowser navigation timed out for {url}", file=sys.stderr)
+            _blank_page(page)
+            return None
 
-            try:
-                page.wait_for_load_state("networkidle", timeout=15_000)
-            except PWTimeout:
-                print(f"  networkidle timed out for {url} (non-fatal)", file=sys.stderr)
+        # Wait for the article markup itself rather than for the network to go quiet
+        try:
+            page.wait_for_selector("section div[style]", state="attached", timeout=15_000)
+        except PWTimeout:
+            print(f"  Article content wait timed out for {url} (non-fatal)", file=sys.stderr)
 
-            try:
-                page.evaluate("""
-                    async () => {
-                        const delay = ms => new Promise(r => setTimeout(r, ms));
-                        const h = document.body.scrollHeight;
-                        let pos = 0;
-                        while (pos < h) {
-                            const amt = Math.floor(Math.random() * 400) + 300;
-                            window.scrollBy(0, amt);
-                            pos += amt;
-                            await delay(Math.random() * 500 + 300);
-                        }
-                        window.scrollTo(0, 0);
-                        await delay(500);
+        try:
+            page.evaluate("""
+                async () => {
+                    const delay = ms => new Promise(r => setTimeout(r, ms));
+                    const h = document.body.scrollHeight;
+                    let pos = 0;
+                    while (pos < h) {
+                        const amt = Math.floor(Math.random() * 400) + 300;
+                        window.scrollBy(0, amt);
+                        pos += amt;
+                        await delay(Math.random() * 500 + 300);
                     }
-                """)
-            except Exception as e:
-                print(f"  Scroll error (non-fatal): {e}", file=sys.stderr)
-
-            html = page.content()
-            page.close(); context.close(); browser.close()
+                    window.scrollTo(0, 0);
+                    await delay(500);
+                }
+            """)
+        except Exception as e:
+            print(f"  Scroll error (non-fatal): {e}", file=sys.stderr)
+
+        if DEBUG_DUMPS:
+            # Keep the whole page so a debug dump shows what actually loaded
+            html, has_section = page.content(), False
+        else:
+            # The extractor only reads the first <section>, so don't serialise the whole page
+            html, has_section = page.evaluate("""
+                () => {
+                    const s = document.querySelector('section');
+                    return [(s || document.documentElement).outerHTML, !!s];
+                }
+            """)
+        _blank_page(page)
 
     except Exception as e:
         print(f"  ⚠️  BotBrowser Playwright error for {url}: {e}", file=sys.stderr)
+        _close_page()
         return None
 
-    if not html or len(html) < 500:
-        print(f"  ⚠️  BotBrowser returned suspiciously short HTML ({len(html)} bytes) for {url}",
+    # A bare <section> can legitimately be small; the length check is for whole pages
+    if not html or (not has_section and len(html) < 500):
+        print(f"  ⚠️  BotBrowser returned suspiciously short HTML ({len(html or '')} bytes) for {url}",
               file=sys.stderr)
         return None
 
@@ -224,6 +364,7 @@ def botbrowser_get(url: str, retries: int = 2) -> str | None:
 
 def _botbrowser_shutdown():
     global _botbrowser_proc
+    _close_page()
     if _botbrowser_proc is not None and _botbrowser_proc.poll() is None:
         print(f"Shutting down BotBrowser (pid {_botbrowser_proc.pid})", file=sys.stderr)
         _botbrowser_proc.terminate()
@@ -238,105 +379,324 @@ def _botbrowser_shutdown():
 # Article Text Extraction
 # ------------------------------
 
-def normalize_style(style_str):
-    if not style_str:
-        return ""
-    return re.sub(r'\s+', '', style_str.lower())
-
-
-def is_content_div(div, style_norm):
-    if 'display:none' in style_norm:
+# One pass over the raw style attribute; each group maps to a bit below.
+# Case and whitespace are handled by the pattern, so styles need no normalising.
+_STYLE_SIG_RE = re.compile(
+    r'(display\s*:\s*none)|(line-height\s*:\s*(?:28|24)\s*px)|(font-size\s*:\s*(?:20|17)\s*px)|(line-height)',
+    re.IGNORECASE,
+)
+_HIDDEN_RE = re.compile(r'display\s*:\s*none', re.IGNORECASE)
+
+_SIG_HIDDEN = 1
+_SIG_LINE_HEIGHT = 2
+_SIG_FONT_SIZE = 4
+_SIG_ANY_LINE_HEIGHT = 8
+
+# Compiled once; both run for every candidate div on every article.
+# Every accepted style carries a line-height, so libxml2 can filter on it
+# (case-insensitively) before any div reaches Python.
+_STYLED_DIVS_XPATH = etree.XPath(
+    ".//div[contains(translate(@style, 'LINEHGT', 'linehgt'), 'line-height')]"
+)
+_HAS_FIGCAPTION_XPATH = etree.XPath("boolean(.//figcaption)")
+
+
+def _style_signature(style):
+    flags = 0
+    for m in _STYLE_SIG_RE.finditer(style):
+        flags |= 1 << (m.lastindex - 1)
+    return flags
+
+
+def is_content_div(div, style):
+    flags = _style_signature(style)
+    if flags & _SIG_HIDDEN:
         return False
-    if div.find('figcaption'):
+    if not (flags & _SIG_LINE_HEIGHT or (flags & _SIG_FONT_SIZE and flags & _SIG_ANY_LINE_HEIGHT)):
         return False
-    if 'line-height:28px' in style_norm or 'line-height:24px' in style_norm:
-        return True
-    if ('font-size:20px' in style_norm or 'font-size:17px' in style_norm) and 'line-height' in style_norm:
-        return True
-    return False
+    # Only walk the subtree for divs whose style already qualifies
+    return not _HAS_FIGCAPTION_XPATH(div)
+
+
+# Built once and reused for every article. Comments and PIs never carry text
+# we want, and the id hash table is never queried.
+_HTML_PARSER = lxml_html.HTMLParser(remove_comments=True, remove_pis=True, collect_ids=False)
+
+_INLINE_TAGS = frozenset(('span', 'small', 'strong', 'em', 'a'))
+
+# Searched case-insensitively so fallback text is never lowercased wholesale
+_BOILERPLATE_RE = re.compile(r'subscribe|sign in|menu|share this', re.IGNORECASE)
+
+
+def _joined_text(el):
+    """Stripped, space-joined text of el and its descendants."""
+    return " ".join(t for t in (s.strip() for s in el.itertext()) if t)
 
 
 def extract_article_text_from_html(html_content):
     if not html_content:
         return ""
 
-    soup = BeautifulSoup(html_content, "html.parser")
-    paragraphs = []
-    seen_texts = set()
+    root = lxml_html.fromstring(html_content, parser=_HTML_PARSER)
+    # Script and stylesheet bodies are never article text
+    etree.strip_elements(root, "script", "style", with_tail=False)
 
-    section = soup.find("section")
-    search_root = section if section else soup
+    # dict as an insertion-ordered set; haystack is every paragraph joined
+    # so one C-level scan tells whether a candidate is already covered
+    paragraphs = {}
+    haystack = ""
 
-    all_divs = search_root.find_all("div", recursive=True)
+    section = next(root.iter("section"), None)
+    search_root = section if section is not None else root
 
-    for div in all_divs:
-        style = div.get("style", "")
-        style_norm = normalize_style(style)
-
-        if not is_content_div(div, style_norm):
+    # Content divs always carry an inline line-height, so skip everything else
+    for div in _STYLED_DIVS_XPATH(search_root):
+        if not is_content_div(div, div.get("style", "")):
             continue
 
+        # Direct text plus text of inline children; block children are skipped
         text_parts = []
-        for child in div.children:
-            if isinstance(child, str):
-                text_parts.append(child.strip())
-            elif child.name in ['span', 'small', 'strong', 'em', 'a']:
-                txt = child.get_text(separator=" ", strip=True)
+        if div.text is not None:
+            text_parts.append(div.text.strip())
+        for child in div:
+            if child.tag in _INLINE_TAGS:
+                txt = _joined_text(child)
                 if txt:
                     text_parts.append(txt)
+            if child.tail is not None:
+                text_parts.append(child.tail.strip())
 
         text = " ".join(text_parts).strip()
 
-        if len(text) > 20 and text not in seen_texts:
-            is_duplicate = False
-            for existing in seen_texts:
-                if text in existing or existing in text:
-                    if len(text) > len(existing):
-                        paragraphs = [p for p in paragraphs if p != existing]
-                        seen_texts.discard(existing)
-                    else:
-                        is_duplicate = True
-                        break
-
-            if not is_duplicate:
-                paragraphs.append(text)
-                seen_texts.add(text)
+        if len(text) > 20 and text not in haystack:
+            # Drop shorter paragraphs that this one contains
+            superseded = [p for p in paragraphs if p in text]
+            for existing in superseded:
+                del paragraphs[existing]
+            paragraphs[text] = None
+            if superseded:
+                haystack = "\0".join(paragraphs)
+            else:
+                haystack += "\0" + text
 
     if len(paragraphs) < 3:
         paragraphs = []
         seen_texts = set()
+        covered = set()
 
-        for div in all_divs:
-            style = div.get("style", "")
-            style_norm = normalize_style(style)
+        for div in search_root.iterdescendants("div"):
+            # An accepted div's text already covers everything nested in it
+            if div in covered:
+                continue
 
-            if 'display:none' in style_norm:
+            if _HIDDEN_RE.search(div.get("style", "")):
                 continue
-            if div.find('figcaption'):
+            if _HAS_FIGCAPTION_XPATH(div):
                 continue
 
-            text = div.get_text(separator=" ", strip=True)
+            text = _joined_text(div)
 
             if len(text) > 50 and text not in seen_texts:
-                if not any(kw in text.lower() for kw in ['subscribe', 'sign in', 'menu', 'share this']):
+                if not _BOILERPLATE_RE.search(text):
                     paragraphs.append(text)
                     seen_texts.add(text)
+                    covered.update(div.iterdescendants("div"))
 
     return "\n\n".join(paragraphs).strip()
 
 
+# ------------------------------
+# Article + Feed Cache
+# ------------------------------
+
+def _open_cache():
+    conn = sqlite3.connect(ARTICLE_CACHE_DB)
+    with conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (link TEXT PRIMARY KEY, fetched_at INTEGER, text TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS feeds (url TEXT PRIMARY KEY, etag TEXT, modified TEXT, body BLOB)"
+        )
+        # Expired rows can never be hits again; keep the file small for actions/cache
+        conn.execute("DELETE FROM cache WHERE fetched_at<=?",
+                     (int(time.time()) - ARTICLE_CACHE_TTL_S,))
+    return conn
+
+
+def _cached_article(conn, link):
+    row = conn.execute(
+        "SELECT text FROM cache WHERE link=? AND fetched_at>?",
+        (link, int(time.time()) - ARTICLE_CACHE_TTL_S),
+    ).fetchone()
+    return row[0] if row else ""
+
+
+def _store_article(conn, link, text):
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (link, fetched_at, text) VALUES (?, ?, ?)",
+            (link, int(time.time()), text),
+        )
+
+
+def _cached_feeds(conn):
+    """Map feed_url -> (etag, modified, body) from the last successful download."""
+    return {
+        url: (etag, modified, body)
+        for url, etag, modified, body in conn.execute("SELECT url, etag, modified, body FROM feeds")
+    }
+
+
+def _store_feed(conn, url, etag, modified, body):
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO feeds (url, etag, modified, body) VALUES (?, ?, ?, ?)",
+            (url, etag, modified, body),
+        )
+
+
 # ------------------------------
 # RSS Helpers
 # ------------------------------
 
+MEDIA_NS = "http://search.yahoo.com/mrss/"
+
+# recover=True keeps us as lenient as feedparser was on slightly broken feeds
+_FEED_PARSER = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+
+
+def fetch_feed(feed_url, etag=None, modified=None):
+    """Download the raw RSS XML for a feed.
+
+    Returns (body, etag, modified). When validators are given and the
+    server answers 304 Not Modified, body is None.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+
+    resp = _SESSION.get(feed_url, headers=headers, timeout=FEED_TIMEOUT_S)
+    if resp.status_code == 304:
+        return None, etag, modified
+    resp.raise_for_status()
+    return resp.content, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+
+
+# Compiled once and evaluated for every <item> of every feed
+_FEED_NS = {
+    "media": MEDIA_NS,
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "atom": "http://www.w3.org/2005/Atom",
+}
+_ITEM_XPATH = etree.XPath("//item")
+_ITEM_LINK_XPATH = etree.XPath("normalize-space(link)", smart_strings=False)
+_ITEM_TITLE_XPATH = etree.XPath("string(title)", smart_strings=False)
+_ITEM_PUBDATE_XPATH = etree.XPath("normalize-space(pubDate)", smart_strings=False)
+_ITEM_UPDATED_XPATH = etree.XPath(
+    "normalize-space(dc:date | atom:updated)", namespaces=_FEED_NS, smart_strings=False
+)
+_ITEM_MEDIA_XPATHS = (
+    etree.XPath("media:content/@url[. != '']", namespaces=_FEED_NS, smart_strings=False),
+    etree.XPath("media:thumbnail/@url[. != '']", namespaces=_FEED_NS, smart_strings=False),
+)
+
+
+def _media_url(item):
+    for xpath in _ITEM_MEDIA_XPATHS:
+        urls = xpath(item)
+        if urls:
+            return urls[0]
+    return None
+
+
+def parse_feed(xml_bytes):
+    """Parse RSS XML into a list of entry dicts (link, title, published, updated, image)."""
+    root = etree.fromstring(xml_bytes, _FEED_PARSER)
+    if root is None:
+        return []
+
+    return [
+        {
+            "link": _ITEM_LINK_XPATH(item),
+            "title": _ITEM_TITLE_XPATH(item),
+            "published": _ITEM_PUBDATE_XPATH(item),
+            "updated": _ITEM_UPDATED_XPATH(item),
+            "image": _media_url(item),
+        }
+        for item in _ITEM_XPATH(root)
+    ]
+
+
+def _load_feed(feed_url, cached):
+    """Fetch one feed, revalidating against the cached copy when there is one.
+
+    Returns (entries_or_exception, fresh_download); fresh_download is the
+    (etag, modified, body) to cache, or None when nothing new was fetched.
+    """
+    etag, modified, cached_body = cached or (None, None, None)
+    try:
+        body, etag, modified = fetch_feed(feed_url, etag, modified)
+        if body is None:
+            print(f"Feed not modified, using cached copy: {feed_url}", file=sys.stderr)
+            return parse_feed(cached_body), None
+        return parse_feed(body), (etag, modified, body)
+    except Exception as e:
+        return e, None
+
+
+def load_feeds(feed_urls, cache):
+    """Fetch and parse all feeds concurrently.
+
+    Returns one entry list per URL, in order; a feed that failed maps to
+    the exception instead so the caller can report it. Downloads that
+    carry an ETag or Last-Modified are kept in the cache so the next run
+    can make a conditional request.
+    """
+    cached = _cached_feeds(cache)
+    with ThreadPoolExecutor(max_workers=FEED_FETCH_WORKERS) as ex:
+        results = list(ex.map(_load_feed, feed_urls, [cached.get(url) for url in feed_urls]))
+
+    # sqlite connections stay on this thread, so write back after the pool is done
+    for feed_url, (_, fresh) in zip(feed_urls, results):
+        if fresh is not None and (fresh[0] or fresh[1]):
+            _store_feed(cache, feed_url, *fresh)
+
+    return [entries for entries, _ in results]
+
+
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def format_rfc822(dt):
+    """Format a datetime as an RFC-822 UTC date without going through strftime."""
+    dt = dt.astimezone(timezone.utc)
+    return (f"{_WEEKDAYS[dt.weekday()]}, {dt.day:02d} {_MONTHS[dt.month - 1]} {dt.year} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} +0000")
+
+
+@lru_cache(maxsize=1024)
+def _parse_feed_date(published):
+    # dc:date / atom:updated are ISO 8601, which the C fromisoformat handles
+    # directly; everything else is RFC-822 from pubDate
+    if published[:4].isdigit():
+        dt = datetime.fromisoformat(published)
+    else:
+        dt = parsedate_to_datetime(published)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
 def parse_pubdate(entry):
     published = entry.get("published") or entry.get("updated") or ""
     if published:
         try:
-            dt = parsedate_to_datetime(published)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
+            return _parse_feed_date(published)
         except Exception:
             pass
     return datetime.now(timezone.utc)
@@ -346,6 +706,24 @@ def parse_pubdate(entry):
 # Main Fetch Logic
 # ------------------------------
 
+_next_request_at = 0.0
+
+
+def _wait_for_request_slot():
+    """Keep archive.is requests 5-10 s apart, start to start.
+
+    Time already spent fetching and extracting the previous article counts
+    towards the gap, so a slow page isn't followed by a full extra sleep.
+    """
+    global _next_request_at
+
+    delay = _next_request_at - time.monotonic()
+    if delay > 0:
+        print(f"Waiting {delay:.1f}s before request...", file=sys.stderr)
+        time.sleep(delay)
+    _next_request_at = time.monotonic() + random.uniform(5, 10)
+
+
 def fetch_items(feed_tuples, per_feed_limit=PER_FEED_LIMIT):
     """
     Fetch and process RSS feed items using BotBrowser.
@@ -354,29 +732,47 @@ def fetch_items(feed_tuples, per_feed_limit=PER_FEED_LIMIT):
     Each feed uses its own archive_prefix when building the archive link.
     """
     items = []
+    # The same article is often listed by several section feeds
+    seen_links = set()
+    cache = _open_cache()
 
     try:
-        for feed_url, archive_prefix in feed_tuples:
+        # All RSS downloads happen up front, before the browser is started
+        feeds = load_feeds([feed_url for feed_url, _ in feed_tuples], cache)
+
+        for (feed_url, archive_prefix), entries in zip(feed_tuples, feeds):
             print(f"\n{'='*60}", file=sys.stderr)
             print(f"Processing feed: {feed_url}", file=sys.stderr)
             print(f"Archive prefix:  {archive_prefix}", file=sys.stderr)
             print(f"{'='*60}", file=sys.stderr)
 
-            feed = feedparser.parse(feed_url)
+            if isinstance(entries, Exception):
+                print(f"❌ Failed to fetch feed: {repr(entries)}", file=sys.stderr)
+                continue
+
             count = 0
 
-            for entry in feed.entries:
+            for entry in entries:
                 if count >= per_feed_limit:
                     break
 
                 link = entry.get("link")
                 if not link:
                     continue
+                if link in seen_links:
+                    # Still uses up a slot, so the feed doesn't reach further back for a replacement
+                    print(f"Skipping duplicate from an earlier feed: {link}", file=sys.stderr)
+                    count += 1
+                    continue
+                seen_links.add(link)
 
                 original_link = link
                 archive_link = archive_prefix + original_link
 
-                article_text = ""
+                article_text = _cached_article(cache, original_link)
+                if article_text:
+                    print(f"\n[{count + 1}/{per_feed_limit}] Cache hit: {original_link}",
+                          file=sys.stderr)
                 retry_count = 0
                 max_retries = 2
 
@@ -385,9 +781,7 @@ def fetch_items(feed_tuples, per_feed_limit=PER_FEED_LIMIT):
                         print(f"\n[{count + 1}/{per_feed_limit}] Fetching: {archive_link}",
                               file=sys.stderr)
 
-                        delay = random.uniform(5, 10)
-                        print(f"Waiting {delay:.1f}s before request...", file=sys.stderr)
-                        time.sleep(delay)
+                        _wait_for_request_slot()
 
                         content = botbrowser_get(archive_link, retries=2)
 
@@ -400,10 +794,10 @@ def fetch_items(feed_tuples, per_feed_limit=PER_FEED_LIMIT):
                                 print(f"⚠️  Short article text ({len(article_text)} chars)",
                                       file=sys.stderr)
 
-                                if retry_count == 0:
-                                    debug_file = f"debug_{count}_{retry_count}.html"
-                                    with open(debug_file, "w", encoding="utf-8") as f:
-                                        f.write(content)
+                                if DEBUG_DUMPS and retry_count == 0:
+                                    debug_file = f"debug_{count}_{retry_count}.html.gz"
+                                    with open(debug_file, "wb") as f:
+                                        f.write(gzip.compress(content.encode("utf-8")))
                                     print(f"Debug file saved: {debug_file}", file=sys.stderr)
 
                                 article_text = ""
@@ -413,6 +807,7 @@ def fetch_items(feed_tuples, per_feed_limit=PER_FEED_LIMIT):
                                           file=sys.stderr)
                                     time.sleep(random.uniform(10, 15))
                             else:
+                                _store_article(cache, original_link, article_text)
                                 break
 
                         else:
@@ -427,14 +822,10 @@ def fetch_items(feed_tuples, per_feed_limit=PER_FEED_LIMIT):
                         if retry_count < max_retries:
                             time.sleep(random.uniform(10, 15))
 
-                image_url = None
-                if hasattr(entry, "media_content") and entry.media_content:
-                    image_url = entry.media_content[0].get("url")
-                elif hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
-                    image_url = entry.media_thumbnail[0].get("url")
+                image_url = entry["image"]
 
                 pub_dt = parse_pubdate(entry)
-                pub_str = pub_dt.strftime("%a, %d %b %Y %H:%M:%S +0000")
+                pub_str = format_rfc822(pub_dt)
 
                 items.append({
                     "title": entry.get("title", "").strip(),
@@ -442,7 +833,7 @@ def fetch_items(feed_tuples, per_feed_limit=PER_FEED_LIMIT):
                     "original_link": original_link,
                     "description": article_text,
                     "pubDate": pub_str,
-                    "pub_dt": pub_dt,
+                    "pub_ts": int(pub_dt.timestamp()),
                     "image": image_url,
                 })
 
@@ -454,38 +845,73 @@ def fetch_items(feed_tuples, per_feed_limit=PER_FEED_LIMIT):
         print(f"\n❌ Fatal error: {repr(e)}", file=sys.stderr)
         raise
     finally:
+        cache.close()
         _botbrowser_shutdown()
 
-    items.sort(key=lambda x: x["pub_dt"], reverse=True)
-    return items[:MAX_ITEMS]
+    return heapq.nlargest(MAX_ITEMS, items, key=itemgetter("pub_ts"))
 
 
 # ------------------------------
 # RSS Output
 # ------------------------------
 
+# Anything outside the XML 1.0 Char production (control characters,
+# surrogates, U+FFFE/U+FFFF) makes xmlfile raise, so strip it first
+_XML_INVALID_RE = re.compile("[^\x09\x0a\x0d\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]")
+
+
+def _xml_safe(text):
+    return _XML_INVALID_RE.sub("", text)
+
+
+def _write_text_element(xf, tag, text):
+    with xf.element(tag):
+        if text:
+            xf.write(_xml_safe(text))
+
+
 def create_rss(items, outpath="combined.xml"):
-    rss = ET.Element("rss", version="2.0", attrib={"xmlns:media": "http://search.yahoo.com/mrss/"})
-    channel = ET.SubElement(rss, "channel")
-    ET.SubElement(channel, "title").text = "Combined Economist + Project Syndicate RSS Feed"
-    ET.SubElement(channel, "link").text = "https://yourusername.github.io/combined.xml"
-    ET.SubElement(channel, "description").text = (
-        "Combined feed: The Economist and Project Syndicate, with full article text via archive.is."
-    )
-
-    for it in items:
-        i = ET.SubElement(channel, "item")
-        ET.SubElement(i, "title").text = it["title"]
-        ET.SubElement(i, "link").text = it["link"]
-        ET.SubElement(i, "description").text = it["description"]
-        ET.SubElement(i, "pubDate").text = it["pubDate"]
-        if it.get("image"):
-            ET.SubElement(i, "enclosure", url=it["image"], type="image/jpeg")
-            ET.SubElement(i, "media:content", url=it["image"], medium="image")
-
-    xml_bytes = ET.tostring(rss, encoding="utf-8", xml_declaration=True)
-    with open(outpath, "wb") as f:
-        f.write(xml_bytes)
+    """Stream the RSS document to outpath one <item> at a time.
+
+    The feed is written to a temporary file and moved into place at the
+    end, so a failure part way through leaves the previous outpath intact.
+    """
+    tmp_path = outpath + ".tmp"
+    try:
+        _write_rss(items, tmp_path)
+        os.replace(tmp_path, outpath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_rss(items, path):
+    with etree.xmlfile(path, encoding="utf-8") as xf:
+        xf.write_declaration()
+        with xf.element("rss", version="2.0", nsmap={"media": MEDIA_NS}):
+            with xf.element("channel"):
+                _write_text_element(xf, "title", "Combined Economist + Project Syndicate RSS Feed")
+                _write_text_element(xf, "link", "https://yourusername.github.io/combined.xml")
+                _write_text_element(xf, "description", (
+                    "Combined feed: The Economist and Project Syndicate, with full article text via archive.is."
+                ))
+
+                for it in items:
+                    with xf.element("item"):
+                        _write_text_element(xf, "title", it["title"])
+                        _write_text_element(xf, "link", it["link"])
+                        _write_text_element(xf, "description", it["description"])
+                        _write_text_element(xf, "pubDate", it["pubDate"])
+                        if it.get("image"):
+                            image = _xml_safe(it["image"])
+                            with xf.element("enclosure", url=image, type="image/jpeg"):
+                                pass
+                            with xf.element(f"{{{MEDIA_NS}}}content", url=image, medium="image"):
+                                pass
+                    xf.flush()
 
 
 # ------------------------------